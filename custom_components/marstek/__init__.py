@@ -8,7 +8,15 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 
-from .const import CONF_HOST, CONF_PORT, CONF_UPDATE_INTERVAL, DEFAULT_UDP_PORT, DEFAULT_UPDATE_INTERVAL, DOMAIN
+from .const import (
+    CONF_DEVICE_INFO,
+    CONF_HOST,
+    CONF_PORT,
+    CONF_UPDATE_INTERVAL,
+    DEFAULT_UDP_PORT,
+    DEFAULT_UPDATE_INTERVAL,
+    DOMAIN,
+)
 from .coordinator import MarstekDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -24,7 +32,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass,
         entry.data[CONF_HOST],
         entry.data.get(CONF_PORT, DEFAULT_UDP_PORT),
-        entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
+        entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+        entry,
     )
     
     # Connect the API client
@@ -34,7 +43,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.error("Failed to connect to Marstek device: %s", err)
         return False
     
-    await coordinator.async_config_entry_first_refresh()
+    # Device info persisted by the config flow saves a round trip at startup
+    if device_info := entry.data.get(CONF_DEVICE_INFO):
+        coordinator.api.seed_cached_data("device_info", device_info)
+    
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # Release the shared port before Home Assistant retries the setup
+        await coordinator.api.disconnect()
+        raise
     
     hass.data[DOMAIN][entry.entry_id] = coordinator
     
@@ -12,7 +12,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 
-from .const import CONF_PORT, CONF_UPDATE_INTERVAL, DEFAULT_UDP_PORT, DEFAULT_UPDATE_INTERVAL, DOMAIN
+from .const import CONF_DEVICE_INFO, CONF_PORT, CONF_UPDATE_INTERVAL, DEFAULT_UDP_PORT, DEFAULT_UPDATE_INTERVAL, DOMAIN
 from .marstek_api import MarstekUDPClient, MarstekAPIError
 
 _LOGGER = logging.getLogger(__name__)
@@ -74,7 +74,15 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception")
                 errors["base"] = "unknown"
             else:
-                return self.async_create_entry(title=info["title"], data=user_input)
+                # The same device should only be polled by one entry
+                await self.async_set_unique_id(
+                    info["device_info"].get("ble_mac") or user_input[CONF_HOST]
+                )
+                self._abort_if_unique_id_configured()
+                return self.async_create_entry(
+                    title=info["title"],
+                    data={**user_input, CONF_DEVICE_INFO: info["device_info"]},
+                )
 
         return self.async_show_form(
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
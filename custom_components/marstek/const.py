@@ -4,10 +4,15 @@ DOMAIN = "marstek"
 DEFAULT_NAME = "Marstek Device"
 DEFAULT_UPDATE_INTERVAL = 30
 
+# Poll less often after this many consecutive refreshes without changes
+IDLE_REFRESH_STREAK = 5
+IDLE_UPDATE_INTERVAL = 120
+
 # Configuration keys
 CONF_HOST = "host"
 CONF_PORT = "port"
 CONF_UPDATE_INTERVAL = "update_interval"
+CONF_DEVICE_INFO = "device_info"
 
 # Default UDP port for Marstek API
 DEFAULT_UDP_PORT = 30000
@@ -32,6 +37,7 @@ METHOD_EM_STATUS = "EM.GetStatus"
 # Connection parameters
 COMMAND_TIMEOUT = 5
 COMMAND_MAX_ATTEMPTS = 3
+COMMAND_MAX_CONCURRENCY = 8
 COMMAND_BACKOFF_BASE = 0.5
 COMMAND_BACKOFF_FACTOR = 2.0
 COMMAND_BACKOFF_MAX = 8.0
@@ -39,6 +45,16 @@ COMMAND_BACKOFF_JITTER = 0.1
 DISCOVERY_TIMEOUT = 9
 DISCOVERY_BROADCAST_INTERVAL = 2.0
 
+# Socket buffer sizes requested for the shared UDP socket (bytes). Unless the
+# process may force them, the kernel caps these at net.core.rmem_max /
+# net.core.wmem_max on Linux; lower them on memory-constrained hosts.
+UDP_RCVBUF = 4 << 20
+UDP_SNDBUF = 1 << 18
+
+# Seconds a status reply is reused before it is queried again (0 = every refresh)
+SLOW_STATUS_TTL = 300
+DEVICE_INFO_TTL = 86400
+
 # Error codes
 ERROR_METHOD_NOT_FOUND = -32601
 
@@ -6,11 +6,12 @@ from datetime import timedelta
 import logging
 from typing import Any
 
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN
-from .marstek_api import MarstekUDPClient, MarstekAPIError
+from .const import CONF_DEVICE_INFO, DOMAIN, IDLE_REFRESH_STREAK, IDLE_UPDATE_INTERVAL
+from .marstek_api import LIVE_DATA_KEYS, MarstekUDPClient, MarstekAPIError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,25 +25,100 @@ class MarstekDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         host: str,
         port: int,
         update_interval: int,
+        entry: ConfigEntry | None = None,
     ) -> None:
         """Initialize."""
         self.api = MarstekUDPClient(hass, host=host, port=port, remote_port=port)
+        self._entry = entry
+        self._default_update_interval = timedelta(seconds=update_interval)
+        self._idle_update_interval = max(
+            self._default_update_interval, timedelta(seconds=IDLE_UPDATE_INTERVAL)
+        )
+        self._idle_streak = 0
+        self._raw_device_info: dict[str, Any] | None = None
+        self.device_info: dict[str, Any] = self._build_device_info({})
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=update_interval),
+            update_interval=self._default_update_interval,
         )
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data via library."""
         try:
-            return await self.api.get_all_data()
+            data = await self.api.get_all_data()
         except MarstekAPIError as exception:
+            self._reset_update_interval()
             raise UpdateFailed(f"Error communicating with Marstek device: {exception}") from exception
         except Exception as exception:
+            self._reset_update_interval()
             raise UpdateFailed(f"Unexpected error: {exception}") from exception
 
+        self._update_device_info(data.get("device_info") or {})
+        self._adjust_update_interval(data)
+        return data
+
+    def _update_device_info(self, raw_device_info: dict[str, Any]) -> None:
+        """Rebuild the shared device info only when the device reply changed."""
+        if raw_device_info is self._raw_device_info:
+            return
+        self._raw_device_info = raw_device_info
+        self.device_info = self._build_device_info(raw_device_info)
+
+        # Persist changed device info (e.g. after a firmware update) so the
+        # next startup can skip fetching it
+        entry = self._entry
+        if entry is not None and raw_device_info and raw_device_info != entry.data.get(CONF_DEVICE_INFO):
+            self.hass.config_entries.async_update_entry(
+                entry, data={**entry.data, CONF_DEVICE_INFO: raw_device_info}
+            )
+
+    def _build_device_info(self, raw_device_info: dict[str, Any]) -> dict[str, Any]:
+        """Build the device registry info shared by all entities."""
+        return {
+            "identifiers": {(DOMAIN, self.api.host)},
+            "name": f"Marstek {raw_device_info.get('device', 'Device')}",
+            "manufacturer": "Marstek",
+            "model": raw_device_info.get("device", "Unknown"),
+            "sw_version": str(raw_device_info.get("ver", "Unknown")),
+            "hw_version": raw_device_info.get("ble_mac", "Unknown"),
+        }
+
+    def _adjust_update_interval(self, data: dict[str, Any]) -> None:
+        """Poll less often while the device reports no changes."""
+        live = all(data.get(key) is not None for key in LIVE_DATA_KEYS)
+        if not live:
+            # An unreachable device also repeats its last (empty) data but
+            # must keep being polled so recovery is noticed quickly
+            self._reset_update_interval()
+            return
+
+        if data == self.data:
+            self._idle_streak += 1
+        else:
+            self._idle_streak = 0
+
+        if self._idle_streak > IDLE_REFRESH_STREAK:
+            self._set_update_interval(self._idle_update_interval)
+        else:
+            self._set_update_interval(self._default_update_interval)
+
+    def _reset_update_interval(self) -> None:
+        """Return to the default interval after a failed or unanswered refresh."""
+        self._idle_streak = 0
+        self._set_update_interval(self._default_update_interval)
+
+    def _set_update_interval(self, update_interval: timedelta) -> None:
+        """Apply a new poll interval if it differs from the current one."""
+        if update_interval != self.update_interval:
+            _LOGGER.debug(
+                "Changing update interval to %s (unchanged refreshes: %d)",
+                update_interval,
+                self._idle_streak,
+            )
+            self.update_interval = update_interval
+
     async def async_shutdown(self) -> None:
         """Shutdown the coordinator and disconnect the API client."""
         await self.api.disconnect()
@@ -2,14 +2,22 @@
 from __future__ import annotations
 
 import asyncio
+import itertools
 import json
 import logging
 import random
 import socket
+import sys
 import time
-from copy import deepcopy
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
 from .const import (
     ALL_API_METHODS,
     COMMAND_BACKOFF_BASE,
@@ -17,8 +25,10 @@ from .const import (
     COMMAND_BACKOFF_JITTER,
     COMMAND_BACKOFF_MAX,
     COMMAND_MAX_ATTEMPTS,
+    COMMAND_MAX_CONCURRENCY,
     COMMAND_TIMEOUT,
     DEFAULT_UDP_PORT,
+    DEVICE_INFO_TTL,
     DISCOVERY_BROADCAST_INTERVAL,
     DISCOVERY_TIMEOUT,
     ERROR_METHOD_NOT_FOUND,
@@ -31,22 +41,116 @@ from .const import (
     METHOD_GET_DEVICE,
     METHOD_PV_STATUS,
     METHOD_WIFI_STATUS,
+    SLOW_STATUS_TTL,
+    UDP_RCVBUF,
+    UDP_SNDBUF,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-# Shared transports and protocols per port to ensure all clients on the same port
-# share the same UDP socket and can receive all messages
-_shared_transports = {}
-_shared_protocols = {}
-_transport_refcounts = {}
-_clients_by_port = {}  # Map port -> list of clients
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize a JSON-RPC payload to bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _json_loads(data: bytes) -> Any:
+    """Deserialize a JSON-RPC payload from bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode())
+
+# Shared endpoint per port to ensure all clients on the same port share the
+# same UDP socket and can receive all messages
+_ports: dict[int, _PortState] = {}
+
+# Message IDs are allocated from one counter so that responses can be routed by
+# ID alone, even when several clients share a port. ID 0 is reserved for
+# discovery broadcasts.
+_msg_ids = itertools.count(1)
+
+# Commands that change device state; these are never coalesced
+_WRITE_METHODS = frozenset({METHOD_ES_SET_MODE})
+
+# Capped exponential backoff per retry; later attempts reuse the last delay
+_BACKOFF_DELAYS = tuple(
+    min(COMMAND_BACKOFF_BASE * COMMAND_BACKOFF_FACTOR**i, COMMAND_BACKOFF_MAX)
+    for i in range(16)
+)
+
+# reuse_port is not supported on Windows
+_SUPPORTS_REUSE_PORT = sys.platform != "win32"
+
+# Commands fetched on refresh as (data key, method, params, ttl seconds).
+# Replies with a non-zero TTL are reused until they expire; WiFi and BLE
+# status change rarely and are not needed on every poll, and device info only
+# changes with a firmware update, so it is re-checked once a day.
+_ALL_DATA_COMMANDS: tuple[tuple[str, str, dict[str, Any], float], ...] = (
+    ("device_info", METHOD_GET_DEVICE, {"ble_mac": "0"}, DEVICE_INFO_TTL),
+    ("wifi", METHOD_WIFI_STATUS, {"id": 0}, SLOW_STATUS_TTL),
+    ("ble", METHOD_BLE_STATUS, {"id": 0}, SLOW_STATUS_TTL),
+    ("battery", METHOD_BATTERY_STATUS, {"id": 0}, 0),
+    ("energy_system", METHOD_ES_STATUS, {"id": 0}, 0),
+    ("energy_system_mode", METHOD_ES_MODE, {"id": 0}, 0),
+    ("energy_meter", METHOD_EM_STATUS, {"id": 0}, 0),
+    # PV status is only available on Venus D
+    ("pv", METHOD_PV_STATUS, {"id": 0}, 0),
+)
+
+# Rows a model may legitimately not support; an error reply reads as None
+_OPTIONAL_DATA_KEYS = frozenset({"pv"})
+
+# Rows fetched on every refresh; None for one of these means no reply
+LIVE_DATA_KEYS = tuple(
+    key
+    for key, _, _, ttl in _ALL_DATA_COMMANDS
+    if not ttl and key not in _OPTIONAL_DATA_KEYS
+)
+
+
+@dataclass(slots=True)
+class _PortState:
+    """UDP endpoint shared by all clients bound to one local port."""
+
+    transport: asyncio.DatagramTransport
+    protocol: MarstekProtocol
+    refcount: int = 0
+
+
+@dataclass(slots=True)
+class _CommandStats:
+    """Attempt statistics for one API method."""
+
+    total_attempts: int = 0
+    total_success: int = 0
+    total_timeouts: int = 0
+    total_failures: int = 0
+    last_success: bool | None = None
+    last_attempt: int | None = None
+    last_latency: float | None = None
+    last_timeout: bool = False
+    last_error: str | None = None
+    last_error_code: int | None = None
+    last_updated: float | None = None
+    last_success_at: float | None = None
+    last_success_payload: dict[str, Any] | None = None
+    unsupported_error_count: int = 0
+    supported: bool | None = None  # None=unknown, True=supported, False=unsupported
 
 
 class MarstekUDPClient:
     """UDP client for Marstek Local API communication."""
 
-    def __init__(self, hass, host: str | None = None, port: int = DEFAULT_UDP_PORT, remote_port: int | None = None) -> None:
+    def __init__(
+        self,
+        hass,
+        host: str | None = None,
+        port: int = DEFAULT_UDP_PORT,
+        remote_port: int | None = None,
+        max_concurrent_commands: int = COMMAND_MAX_CONCURRENCY,
+    ) -> None:
         """Initialize the UDP client.
 
         Args:
@@ -54,18 +158,22 @@ class MarstekUDPClient:
             host: Target host IP (None for broadcast)
             port: Local port to bind to (0 for ephemeral)
             remote_port: Remote port to send to (defaults to DEFAULT_UDP_PORT)
+            max_concurrent_commands: Commands or batches allowed in flight at once
         """
         self.hass = hass
         self.host = host
         self.port = port
         self.remote_port = remote_port or DEFAULT_UDP_PORT
+        # Resolved (ip, port) of host, filled in on first send
+        self._remote_addr: tuple[str, int] | None = None
         self.transport: asyncio.DatagramTransport | None = None
         self.protocol: MarstekProtocol | None = None
-        self._handlers: list = []
+        self._handlers: set = set()
         self._connected = False
-        self._stale_message_counter = 0
-        self._command_stats: dict[str, dict[str, Any]] = {}
-        self._msg_id_counter = 0  # Counter for integer message IDs
+        self._command_stats: dict[str, _CommandStats] = {}
+        self._data_cache: dict[str, tuple[float, Any]] = {}  # key -> (fetched_at, result)
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        self._command_slots = asyncio.Semaphore(max_concurrent_commands)
 
     async def connect(self) -> None:
         """Connect to the UDP socket."""
@@ -73,7 +181,7 @@ class MarstekUDPClient:
             _LOGGER.debug("Already connected on port %s", self.port)
             return
 
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         self._loop = loop
 
         _LOGGER.info(
@@ -84,23 +192,21 @@ class MarstekUDPClient:
         try:
             # Use shared transport/protocol for this port to ensure all clients
             # on the same port can receive all UDP messages
-            if self.port not in _shared_transports:
+            state = _ports.get(self.port)
+            if state is None:
                 # Create shared UDP endpoint for this port
-                import sys
                 endpoint_kwargs = {
                     "local_addr": ("0.0.0.0", self.port),
                     "allow_broadcast": True,
                 }
-                # reuse_port is not supported on Windows
-                if sys.platform != "win32":
+                if _SUPPORTS_REUSE_PORT:
                     endpoint_kwargs["reuse_port"] = True
                 transport, protocol = await loop.create_datagram_endpoint(
-                    lambda: MarstekProtocol(),
+                    lambda: MarstekProtocol(self.port),
                     **endpoint_kwargs,
                 )
-                _shared_transports[self.port] = transport
-                _shared_protocols[self.port] = protocol
-                _transport_refcounts[self.port] = 0
+                self._tune_socket_buffers(transport.get_extra_info("socket"))
+                state = _ports[self.port] = _PortState(transport, protocol)
 
                 _LOGGER.info(
                     "Created shared UDP socket on port %s",
@@ -108,22 +214,19 @@ class MarstekUDPClient:
                 )
 
             # Use the shared transport/protocol
-            self.transport = _shared_transports[self.port]
-            self.protocol = _shared_protocols[self.port]
-            _transport_refcounts[self.port] += 1
+            self.transport = state.transport
+            self.protocol = state.protocol
+            state.refcount += 1
 
             # Register this client for message dispatching
-            if self.port not in _clients_by_port:
-                _clients_by_port[self.port] = []
-            if self not in _clients_by_port[self.port]:
-                _clients_by_port[self.port].append(self)
+            self.protocol.clients.add(self)
 
             self._connected = True
             sock = self.transport.get_extra_info('socket')
             _LOGGER.info(
                 "UDP socket connected: local_port=%s, socket=%s, refcount=%d, clients=%d",
                 self.port, sock.getsockname() if sock else "unknown",
-                _transport_refcounts[self.port], len(_clients_by_port[self.port])
+                state.refcount, len(self.protocol.clients)
             )
         except Exception as err:
             _LOGGER.error(
@@ -132,39 +235,62 @@ class MarstekUDPClient:
             )
             raise
 
+    def _tune_socket_buffers(self, sock: socket.socket | None) -> None:
+        """Enlarge the socket buffers so bursts of replies are not dropped."""
+        if sock is None:
+            return
+        for option, force_option, size in (
+            (socket.SO_RCVBUF, getattr(socket, "SO_RCVBUFFORCE", None), UDP_RCVBUF),
+            (socket.SO_SNDBUF, getattr(socket, "SO_SNDBUFFORCE", None), UDP_SNDBUF),
+        ):
+            # The *FORCE variants (Linux, CAP_NET_ADMIN) bypass net.core.*mem_max
+            if force_option is not None:
+                try:
+                    sock.setsockopt(socket.SOL_SOCKET, force_option, size)
+                    continue
+                except OSError:
+                    pass
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, option, size)
+            except OSError as err:
+                _LOGGER.warning("Could not set UDP socket buffer size: %s", err)
+
+        _LOGGER.debug(
+            "UDP socket buffers on port %s: rcvbuf=%d, sndbuf=%d",
+            self.port,
+            sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF),
+            sock.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF),
+        )
+
     async def disconnect(self) -> None:
         """Disconnect from the UDP socket."""
+        # Shared exchanges outlive their callers; stop them with the client
+        for inflight in tuple(self._inflight.values()):
+            inflight.cancel()
+
         if not self._connected:
             return
 
-        if self.port in _transport_refcounts:
+        state = _ports.get(self.port)
+        if state is not None:
             # Unregister this client from message dispatching
-            if self.port in _clients_by_port and self in _clients_by_port[self.port]:
-                _clients_by_port[self.port].remove(self)
+            state.protocol.clients.discard(self)
 
-            _transport_refcounts[self.port] -= 1
+            state.refcount -= 1
 
             # Only close the shared transport when last client disconnects
-            if _transport_refcounts[self.port] <= 0:
-                if self.transport:
-                    try:
-                        self.transport.close()
-                    except Exception as err:
-                        _LOGGER.warning("Error closing transport: %s", err)
-
-                if self.port in _shared_transports:
-                    del _shared_transports[self.port]
-                if self.port in _shared_protocols:
-                    del _shared_protocols[self.port]
-                if self.port in _transport_refcounts:
-                    del _transport_refcounts[self.port]
-                if self.port in _clients_by_port:
-                    del _clients_by_port[self.port]
+            if state.refcount <= 0:
+                try:
+                    state.transport.close()
+                except Exception as err:
+                    _LOGGER.warning("Error closing transport: %s", err)
+
+                del _ports[self.port]
                 _LOGGER.debug("Closed shared UDP socket on port %s", self.port)
             else:
                 _LOGGER.debug(
                     "UDP socket disconnected, %d clients still connected on port %s",
-                    _transport_refcounts[self.port], self.port
+                    state.refcount, self.port
                 )
 
         self.transport = None
@@ -173,43 +299,45 @@ class MarstekUDPClient:
 
     def register_handler(self, handler) -> None:
         """Register a message handler."""
-        if handler not in self._handlers:
-            self._handlers.append(handler)
+        self._handlers.add(handler)
 
     def unregister_handler(self, handler) -> None:
         """Unregister a message handler."""
-        if handler in self._handlers:
-            self._handlers.remove(handler)
+        self._handlers.discard(handler)
 
-    async def _handle_message(self, data: bytes, addr: tuple) -> None:
-        """Handle incoming UDP message.
-
-        This method is called by the shared protocol and needs to dispatch
-        the message to all clients sharing this port.
-        """
-        try:
-            message = json.loads(data.decode())
-            _LOGGER.debug(
-                "Received UDP message from %s:%s (size=%d bytes): %s",
-                addr[0], addr[1], len(data), message
-            )
-
-            # Call all registered handlers from THIS client
-            handlers_called = 0
-            for handler in self._handlers:
-                try:
-                    # Handler can be sync or async
-                    result = handler(message, addr)
-                    if asyncio.iscoroutine(result):
-                        await result
-                    handlers_called += 1
-                except Exception as err:
-                    _LOGGER.error("Error in message handler: %s", err, exc_info=True)
+    def _dispatch_message(self, message: dict[str, Any], addr: tuple) -> None:
+        """Pass an unsolicited message (e.g. a discovery reply) to this client's handlers."""
+        for handler in tuple(self._handlers):
+            try:
+                # Handler can be sync or async
+                result = handler(message, addr)
+                if asyncio.iscoroutine(result):
+                    asyncio.create_task(result)
+            except Exception as err:
+                _LOGGER.error("Error in message handler: %s", err, exc_info=True)
 
-            _LOGGER.debug("Called %d handler(s) for message from %s", handlers_called, addr[0])
+    async def _coalesced(self, key: tuple, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run factory() once for all concurrent callers using the same key.
 
-        except json.JSONDecodeError as err:
-            _LOGGER.error("Failed to decode JSON message from %s: %s (data: %s)", addr, err, data[:200])
+        The shared task is shielded so that one caller being cancelled does
+        not cancel the exchange for the others; disconnect() cancels it.
+        """
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(factory())
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda task: self._inflight_done(key, task))
+        return await asyncio.shield(inflight)
+
+    def _inflight_done(self, key: tuple, task: asyncio.Future) -> None:
+        """Forget a finished shared exchange and retrieve its outcome.
+
+        Its exception is consumed here so that an exchange whose callers were
+        all cancelled does not log "Task exception was never retrieved".
+        """
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()
 
     async def send_command(
         self,
@@ -218,86 +346,86 @@ class MarstekUDPClient:
         timeout: int | None = None,
         max_attempts: int | None = None,
     ) -> dict | None:
-        """Send a command and wait for response."""
-        if not self._connected:
-            await self.connect()
+        """Send a command and wait for response.
 
+        Concurrent reads with the same method, params, timeout and attempt
+        limit share one exchange. Writes are always sent on their own.
+        """
         if params is None:
             params = {"id": 0}
 
+        if method in _WRITE_METHODS:
+            return await self._send_command(method, params, timeout, max_attempts)
+
+        return await self._coalesced(
+            ("command", method, _json_dumps(params), timeout, max_attempts),
+            lambda: self._send_command(method, params, timeout, max_attempts),
+        )
+
+    async def _send_command(
+        self,
+        method: str,
+        params: dict,
+        timeout: int | None,
+        max_attempts: int | None,
+    ) -> dict | None:
+        """Send a command once a command slot is free."""
+        async with self._command_slots:
+            return await self._send_command_attempts(method, params, timeout, max_attempts)
+
+    async def _send_command_attempts(
+        self,
+        method: str,
+        params: dict,
+        timeout: int | None,
+        max_attempts: int | None,
+    ) -> dict | None:
+        """Send a command and wait for response, retrying on timeout."""
+        if not self._connected:
+            await self.connect()
+        await self._resolve_remote_addr()
+
         effective_timeout = timeout if timeout is not None else COMMAND_TIMEOUT
         attempt_limit = max_attempts if max_attempts is not None else COMMAND_MAX_ATTEMPTS
 
-        # Generate unique integer message ID (required for Venus E firmware V139+)
-        self._msg_id_counter = (self._msg_id_counter + 1) % 1000000  # Wrap at 1 million
-        msg_id = self._msg_id_counter
+        msg_id = self._next_msg_id()
         payload = {
             "id": msg_id,
             "method": method,
             "params": params,
         }
-        payload_str = json.dumps(payload)
+        payload_bytes = _json_dumps(payload)
 
-        _LOGGER.debug(
-            "Sending command: method=%s, id=%s, host=%s, port=%s, transport=%s",
-            method, msg_id, self.host, self.remote_port, self.transport is not None
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Sending command: method=%s, id=%s, host=%s, port=%s, transport=%s",
+                method, msg_id, self.host, self.remote_port, self.transport is not None
+            )
 
-        # Shared response tracking for all attempts
-        response_event = asyncio.Event()
-        response_data: dict[str, Any] = {}
         last_exception: Exception | None = None
-
-        # Allow the event loop to process any pending datagrams before we start
-        await asyncio.sleep(0)
-
-        def handler(message, addr):
-            """Handle command response."""
-            if message.get("id") == msg_id:
-                if self.host and addr[0] != self.host:
-                    _LOGGER.debug("Ignoring response from wrong host: %s (expected %s)", addr[0], self.host)
-                    return  # Wrong device
-                _LOGGER.debug("Matched response for %s from %s", method, addr)
-                response_data.clear()
-                response_data.update(message)
-                response_event.set()
-            else:
-                # Track stray messages so we know if queues are backing up
-                self._stale_message_counter += 1
-                if self._stale_message_counter <= 5 or self._stale_message_counter % 25 == 0:
-                    _LOGGER.debug(
-                        "Ignoring stale message while waiting for %s: got id=%s from %s (total stales=%d)",
-                        method,
-                        message.get("id"),
-                        addr[0],
-                        self._stale_message_counter,
-                    )
-
-        # Register temporary handler
-        self.register_handler(handler)
+        protocol = self.protocol
 
         try:
             loop = asyncio.get_running_loop()
 
             for attempt in range(1, attempt_limit + 1):
-                response_event.clear()
-                response_data.clear()
+                # The protocol resolves this future with the response for msg_id
+                response_future = protocol.expect_response(msg_id, self._remote_ip)
                 attempt_started = loop.time()
 
                 try:
-                    _LOGGER.debug(
-                        "Sending payload (attempt %d/%d) to %s:%s: %s",
-                        attempt,
-                        attempt_limit,
-                        self.host or "broadcast",
-                        self.remote_port,
-                        payload_str,
-                    )
-                    # Yield once more to ensure pending packets are processed before sending
-                    await asyncio.sleep(0)
-                    await self._send_to_host(payload_str)
+                    if _LOGGER.isEnabledFor(logging.DEBUG):
+                        _LOGGER.debug(
+                            "Sending payload (attempt %d/%d) to %s:%s: %s",
+                            attempt,
+                            attempt_limit,
+                            self.host or "broadcast",
+                            self.remote_port,
+                            payload_bytes,
+                        )
+                    await self._send_to_host(payload_bytes)
 
-                    await asyncio.wait_for(response_event.wait(), timeout=effective_timeout)
+                    response_data = await asyncio.wait_for(response_future, timeout=effective_timeout)
 
                     if "error" in response_data:
                         error = response_data["error"]
@@ -318,7 +446,6 @@ class MarstekUDPClient:
                         )
 
                     latency = loop.time() - attempt_started
-                    self._stale_message_counter = 0
                     self._record_command_result(
                         method,
                         success=True,
@@ -390,7 +517,7 @@ class MarstekUDPClient:
                     await asyncio.sleep(delay)
 
         finally:
-            self.unregister_handler(handler)
+            protocol.discard_response(msg_id)
 
         if last_exception:
             raise last_exception
@@ -402,25 +529,198 @@ class MarstekUDPClient:
         )
         return None
 
-    async def _send_to_host(self, message: str) -> None:
+    async def send_batch(
+        self,
+        commands: list[tuple[str, dict | None]],
+        timeout: int | None = None,
+        max_attempts: int | None = None,
+    ) -> list[Any]:
+        """Pipeline several commands and wait for all responses at once.
+
+        All requests are sent back-to-back with distinct message IDs and the
+        replies are demultiplexed by ID, so a batch costs roughly one round
+        trip instead of one per command. Only requests that are still
+        unanswered are resent on retry.
+
+        Returns a list aligned with ``commands`` holding the ``result`` of each
+        response, a ``MarstekAPIError`` for error responses, or None when no
+        response arrived within the allowed attempts.
+        """
+        async with self._command_slots:
+            return await self._send_batch(commands, timeout, max_attempts)
+
+    async def _send_batch(
+        self,
+        commands: list[tuple[str, dict | None]],
+        timeout: int | None,
+        max_attempts: int | None,
+    ) -> list[Any]:
+        """Send a batch and collect its responses, resending unanswered requests."""
+        if not self._connected:
+            await self.connect()
+        await self._resolve_remote_addr()
+
+        effective_timeout = timeout if timeout is not None else COMMAND_TIMEOUT
+        attempt_limit = max_attempts if max_attempts is not None else COMMAND_MAX_ATTEMPTS
+
+        results: list[Any] = [None] * len(commands)
+        payloads: dict[int, bytes] = {}
+        pending: dict[int, int] = {}  # msg_id -> index into commands
+        for index, (method, params) in enumerate(commands):
+            msg_id = self._next_msg_id()
+            pending[msg_id] = index
+            payloads[msg_id] = _json_dumps({
+                "id": msg_id,
+                "method": method,
+                "params": params if params is not None else {"id": 0},
+            })
+
+        if not pending:
+            return results
+
+        loop = asyncio.get_running_loop()
+        protocol = self.protocol
+
+        try:
+            for attempt in range(1, attempt_limit + 1):
+                attempt_started = loop.time()
+                deadline = attempt_started + effective_timeout
+                _LOGGER.debug(
+                    "Sending batch of %d command(s) (attempt %d/%d) to %s:%s",
+                    len(pending),
+                    attempt,
+                    attempt_limit,
+                    self.host or "broadcast",
+                    self.remote_port,
+                )
+                waiting: dict[asyncio.Future, int] = {}
+                for msg_id in pending:
+                    waiting[protocol.expect_response(msg_id, self._remote_ip)] = msg_id
+                    await self._send_to_host(payloads[msg_id])
+
+                while waiting and (remaining := deadline - loop.time()) > 0:
+                    done, _ = await asyncio.wait(
+                        waiting, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for response_future in done:
+                        msg_id = waiting.pop(response_future)
+                        index = pending.pop(msg_id)
+                        message = response_future.result()
+                        method = commands[index][0]
+
+                        if "error" in message:
+                            error = message["error"]
+                            error_code = error.get("code")
+                            error_msg = error.get("message")
+                            self._record_command_result(
+                                method,
+                                success=False,
+                                attempt=attempt,
+                                latency=None,
+                                timeout=False,
+                                error=error_msg,
+                                error_code=error_code,
+                            )
+                            results[index] = MarstekAPIError(f"API error {error_code}: {error_msg}")
+                        else:
+                            self._record_command_result(
+                                method,
+                                success=True,
+                                attempt=attempt,
+                                latency=loop.time() - attempt_started,
+                                timeout=False,
+                                error=None,
+                                error_code=None,
+                                response=message,
+                            )
+                            results[index] = message.get("result")
+
+                if not pending:
+                    break
+
+                for response_future in waiting:
+                    response_future.cancel()
+                for index in pending.values():
+                    self._record_command_result(
+                        commands[index][0],
+                        success=False,
+                        attempt=attempt,
+                        latency=None,
+                        timeout=True,
+                        error="timeout",
+                    )
+                _LOGGER.warning(
+                    "Batch timed out after %ss with %d of %d command(s) unanswered (attempt %d/%d, host=%s)",
+                    effective_timeout,
+                    len(pending),
+                    len(commands),
+                    attempt,
+                    attempt_limit,
+                    self.host,
+                )
+
+                if attempt < attempt_limit:
+                    delay = self._compute_backoff_delay(attempt)
+                    _LOGGER.debug(
+                        "Waiting %.2fs before retrying %d command(s) (attempt %d/%d)",
+                        delay,
+                        len(pending),
+                        attempt + 1,
+                        attempt_limit,
+                    )
+                    await asyncio.sleep(delay)
+        finally:
+            for msg_id in payloads:
+                protocol.discard_response(msg_id)
+
+        return results
+
+    async def _resolve_remote_addr(self) -> None:
+        """Resolve host once, on first use.
+
+        Resolution happens on the command path rather than in connect() so a
+        temporary DNS failure fails the refresh (and is retried) instead of
+        failing setup.
+        """
+        if not self.host or self._remote_addr is not None:
+            return
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(
+                self.host,
+                self.remote_port,
+                family=socket.AF_INET,
+                type=socket.SOCK_DGRAM,
+            )
+        except OSError as err:
+            raise MarstekAPIError(f"Could not resolve {self.host}: {err}") from err
+        self._remote_addr = infos[0][4]
+
+    @property
+    def _remote_ip(self) -> str | None:
+        """Return the resolved IP of host, or None when broadcasting."""
+        return self._remote_addr[0] if self._remote_addr else None
+
+    def _next_msg_id(self) -> int:
+        """Allocate the next message ID."""
+        # Unique integer message IDs are required for Venus E firmware V139+
+        return next(_msg_ids) % 999999 + 1  # Wrap below 1 million, skipping 0
+
+    async def _send_to_host(self, message: bytes) -> None:
         """Send message to specific host or broadcast."""
         if not self.transport:
             raise MarstekAPIError("Not connected")
 
         if self.host:
             # Send to specific host on remote port
-            self.transport.sendto(
-                message.encode(),
-                (self.host, self.remote_port)
-            )
+            await self._resolve_remote_addr()
+            self.transport.sendto(message, self._remote_addr)
         else:
             # Broadcast
             await self.broadcast(message)
 
     def _compute_backoff_delay(self, attempt: int) -> float:
         """Compute exponential backoff with jitter for retries."""
-        base_delay = COMMAND_BACKOFF_BASE * (COMMAND_BACKOFF_FACTOR ** (attempt - 1))
-        capped = min(base_delay, COMMAND_BACKOFF_MAX)
+        capped = _BACKOFF_DELAYS[min(attempt, len(_BACKOFF_DELAYS)) - 1]
         if COMMAND_BACKOFF_JITTER > 0:
             return capped + random.uniform(0, COMMAND_BACKOFF_JITTER)
         return capped
@@ -438,54 +738,38 @@ class MarstekUDPClient:
         response: dict[str, Any] | None = None,
     ) -> None:
         """Track command attempt statistics for diagnostics."""
-        stats = self._command_stats.setdefault(
-            method,
-            {
-                "total_attempts": 0,
-                "total_success": 0,
-                "total_timeouts": 0,
-                "total_failures": 0,
-                "last_success": None,
-                "last_attempt": None,
-                "last_latency": None,
-                "last_timeout": False,
-                "last_error": None,
-                "last_error_code": None,
-                "last_updated": None,
-                "last_success_at": None,
-                "last_success_payload": None,
-                "unsupported_error_count": 0,
-                "supported": None,  # None=unknown, True=supported, False=unsupported
-            },
-        )
+        stats = self._command_stats.get(method)
+        if stats is None:
+            stats = self._command_stats[method] = _CommandStats()
 
-        stats["total_attempts"] += 1
+        stats.total_attempts += 1
         if success:
-            stats["total_success"] += 1
-            stats["supported"] = True  # Command works on this device
+            stats.total_success += 1
+            stats.supported = True  # Command works on this device
         elif timeout:
-            stats["total_timeouts"] += 1
+            stats.total_timeouts += 1
         else:
-            stats["total_failures"] += 1
-
-        stats["last_success"] = success
-        stats["last_attempt"] = attempt
-        stats["last_latency"] = latency
-        stats["last_timeout"] = timeout
-        stats["last_error"] = error
-        stats["last_error_code"] = error_code
-        stats["last_updated"] = time.time()
+            stats.total_failures += 1
+
+        stats.last_success = success
+        stats.last_attempt = attempt
+        stats.last_latency = latency
+        stats.last_timeout = timeout
+        stats.last_error = error
+        stats.last_error_code = error_code
+        stats.last_updated = time.time()
         if success:
-            stats["last_success_at"] = stats["last_updated"]
-            stats["last_success_payload"] = deepcopy(response) if response is not None else None
+            stats.last_success_at = stats.last_updated
+            # Stored by reference; responses are treated as read-only once parsed
+            stats.last_success_payload = response
 
         # Track "Method not found" errors to detect unsupported commands
         if error_code == ERROR_METHOD_NOT_FOUND:
-            stats["unsupported_error_count"] += 1
-            if stats["unsupported_error_count"] >= 3:
-                stats["supported"] = False
+            stats.unsupported_error_count += 1
+            if stats.unsupported_error_count >= 3:
+                stats.supported = False
 
-    async def broadcast(self, message: str) -> None:
+    async def broadcast(self, message: bytes) -> None:
         """Broadcast a message."""
         if not self.transport:
             await self.connect()
@@ -494,7 +778,7 @@ class MarstekUDPClient:
         broadcast_addr = self._get_broadcast_address()
 
         self.transport.sendto(
-            message.encode(),
+            message,
             (broadcast_addr, self.remote_port)
         )
         _LOGGER.debug("Broadcast message: %s", message)
@@ -596,22 +880,24 @@ class MarstekUDPClient:
             _LOGGER.debug("Broadcasting to networks: %s", broadcast_addrs)
 
             # Broadcast discovery message repeatedly on all networks
-            end_time = asyncio.get_event_loop().time() + timeout
-            message = json.dumps({
+            loop = asyncio.get_running_loop()
+            end_time = loop.time() + timeout
+            message = _json_dumps({
                 "id": 0,
                 "method": METHOD_GET_DEVICE,
                 "params": {"ble_mac": "0"}
             })
 
-            while asyncio.get_event_loop().time() < end_time:
+            while (remaining := end_time - loop.time()) > 0:
                 # Broadcast to all networks
                 for broadcast_addr in broadcast_addrs:
                     if self.transport:
                         self.transport.sendto(
-                            message.encode(),
+                            message,
                             (broadcast_addr, self.remote_port)
                         )
-                await asyncio.sleep(DISCOVERY_BROADCAST_INTERVAL)
+                # Never sleep past the deadline
+                await asyncio.sleep(min(DISCOVERY_BROADCAST_INTERVAL, remaining))
 
             # Wait a bit longer for any delayed responses
             _LOGGER.debug("Waiting for delayed responses...")
@@ -719,31 +1005,61 @@ class MarstekUDPClient:
         """Get energy meter status."""
         return await self.send_command(METHOD_EM_STATUS, {"id": instance_id})
 
+    def seed_cached_data(self, key: str, result: dict[str, Any]) -> None:
+        """Seed the refresh cache with a known reply, e.g. persisted device info."""
+        self._data_cache[key] = (asyncio.get_running_loop().time(), result)
+
     async def get_all_data(self) -> dict[str, Any]:
-        """Get all available data from the device."""
+        """Get all available data from the device in a single batched exchange.
+
+        Concurrent calls (e.g. overlapping refreshes) share one exchange.
+        """
+        return await self._coalesced(("get_all_data",), self._fetch_all_data)
+
+    async def _fetch_all_data(self) -> dict[str, Any]:
+        """Fetch all due data from the device.
+
+        Replies for commands with a TTL are served from cache until they
+        expire, so only the due commands go out on the wire. If a due TTL
+        command gets no reply or an error reply, its last good reply is
+        returned instead and the command stays due, so it is retried on the
+        next refresh.
+        """
         try:
+            now = asyncio.get_running_loop().time()
             data = {}
-            
-            # Get device info
-            data["device_info"] = await self.get_device_info()
-            
-            # Get all component statuses
-            data["wifi"] = await self.get_wifi_status()
-            data["ble"] = await self.get_ble_status()
-            data["battery"] = await self.get_battery_status()
-            data["energy_system"] = await self.get_es_status()
-            data["energy_system_mode"] = await self.get_energy_system_mode()
-            data["energy_meter"] = await self.get_energy_meter_status()
-            
-            # Try to get PV status (Venus D only)
-            try:
-                data["pv"] = await self.get_pv_status()
-            except MarstekAPIError:
-                # PV not supported on this model
-                data["pv"] = None
-            
+            due = []
+            for key, method, params, ttl in _ALL_DATA_COMMANDS:
+                cached = self._data_cache.get(key)
+                if ttl and cached is not None and now - cached[0] < ttl:
+                    data[key] = cached[1]
+                else:
+                    due.append((key, method, params, ttl))
+
+            results = await self.send_batch(
+                [(method, params) for _, method, params, _ in due]
+            )
+
+            for (key, _, _, ttl), result in zip(due, results):
+                if isinstance(result, MarstekAPIError):
+                    if key in _OPTIONAL_DATA_KEYS:
+                        # e.g. PV not supported on this model
+                        result = None
+                    elif ttl:
+                        # Slow rows degrade like a timeout: serve the last
+                        # good reply and stay due for the next refresh
+                        _LOGGER.warning("Error fetching %s, using last reply: %s", key, result)
+                        result = None
+                    else:
+                        raise result
+                if result is not None:
+                    self._data_cache[key] = (now, result)
+                elif ttl and key in self._data_cache:
+                    result = self._data_cache[key][1]
+                data[key] = result
+
             return data
-            
+
         except Exception as exc:
             _LOGGER.error("Error fetching all data from Marstek device: %s", exc)
             raise
@@ -752,35 +1068,91 @@ class MarstekUDPClient:
 class MarstekProtocol(asyncio.DatagramProtocol):
     """Protocol for handling UDP datagrams.
 
-    This protocol is shared across all clients on the same port.
-    It dispatches incoming messages to all registered clients.
+    This protocol is shared across all clients on the same port. Each
+    datagram is decoded once; responses are routed by message ID to the
+    command waiting for them and anything else is passed to the handlers of
+    all clients registered on the port.
     """
 
-    def __init__(self) -> None:
-        """Initialize the protocol."""
-        self.port = None  # Will be set when socket is bound
+    __slots__ = ("port", "clients", "_pending", "_stale_message_counter")
+
+    def __init__(self, port: int) -> None:
+        """Initialize the protocol for the given local port."""
+        self.port = port
+        # Clients sharing this endpoint, registered by connect()
+        self.clients: set[MarstekUDPClient] = set()
+        # msg_id -> (expected host or None, future resolved with the response)
+        self._pending: dict[int, tuple[str | None, asyncio.Future]] = {}
+        self._stale_message_counter = 0
+
+    def expect_response(self, msg_id: int, host: str | None) -> asyncio.Future:
+        """Return a future resolved with the next response carrying msg_id.
+
+        Any earlier future for the same ID (e.g. from a previous attempt) is
+        replaced. Responses from hosts other than ``host`` are ignored.
+        """
+        response_future = asyncio.get_running_loop().create_future()
+        self._pending[msg_id] = (host, response_future)
+        return response_future
+
+    def discard_response(self, msg_id: int) -> None:
+        """Stop waiting for a response carrying msg_id."""
+        self._pending.pop(msg_id, None)
 
     def datagram_received(self, data: bytes, addr: tuple) -> None:
         """Handle received datagram.
 
-        Dispatch to all clients registered on this port.
+        Replies are routed by message ID to the one future waiting on
+        them; only unsolicited messages reach the clients on this port.
         """
-        # Get the local port from the transport
-        if self.port is None:
-            try:
-                sock = None
-                # Try to get port from connection (we'll set it properly below)
-                for port, protocol in _shared_protocols.items():
-                    if protocol is self:
-                        self.port = port
-                        break
-            except Exception:
-                pass
-
-        # Dispatch to all clients on this port
-        if self.port and self.port in _clients_by_port:
-            for client in _clients_by_port[self.port]:
-                asyncio.create_task(client._handle_message(data, addr))
+        if not self._pending and not any(client._handlers for client in self.clients):
+            return  # Nobody is waiting for this; don't pay for the decode
+
+        try:
+            message = _json_loads(data)
+        except json.JSONDecodeError as err:
+            _LOGGER.error("Failed to decode JSON message from %s: %s (data: %s)", addr, err, data[:200])
+            return
+
+        if not isinstance(message, dict):
+            _LOGGER.debug("Ignoring non-object UDP message from %s: %s", addr[0], message)
+            return
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Received UDP message from %s:%s (size=%d bytes): %s",
+                addr[0], addr[1], len(data), message
+            )
+
+        msg_id = message.get("id")
+        pending = self._pending.get(msg_id)
+        if pending is not None:
+            host, response_future = pending
+            if host and addr[0] != host:
+                _LOGGER.debug("Ignoring response from wrong host: %s (expected %s)", addr[0], host)
+                return  # Wrong device
+            del self._pending[msg_id]
+            if not response_future.done():
+                response_future.set_result(message)
+            return
+
+        if msg_id != 0:
+            # Track stray responses (e.g. late replies to timed-out commands)
+            self._stale_message_counter += 1
+            if _LOGGER.isEnabledFor(logging.DEBUG) and (
+                self._stale_message_counter <= 5 or self._stale_message_counter % 25 == 0
+            ):
+                _LOGGER.debug(
+                    "Ignoring stale message: got id=%s from %s (total stales=%d)",
+                    msg_id,
+                    addr[0],
+                    self._stale_message_counter,
+                )
+
+        # Dispatch unsolicited messages to all clients on this port
+        if self.clients:
+            for client in tuple(self.clients):
+                client._dispatch_message(message, addr)
         else:
             _LOGGER.warning("Received message but no clients registered for port %s", self.port)
 
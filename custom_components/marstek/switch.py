@@ -6,7 +6,7 @@ from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -16,6 +16,12 @@ from .marstek_api import MarstekAPIError
 
 _LOGGER = logging.getLogger(__name__)
 
+# Battery payload flag reported for each battery switch type
+_BATTERY_FLAG_KEYS = {
+    "charge": "charg_flag",
+    "discharge": "dischrg_flag",
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
@@ -47,41 +53,64 @@ class MarstekModeSwitch(CoordinatorEntity[MarstekDataUpdateCoordinator], SwitchE
         """Initialize the switch."""
         super().__init__(coordinator)
         self._mode = mode
+        self._mode_config = {"mode": mode.capitalize(), f"{mode}_cfg": {"enable": 1}}
         self._attr_name = f"Marstek {name}"
         self._attr_unique_id = f"marstek_mode_{mode}"
-
-    @property
-    def is_on(self) -> bool:
-        """Return true if the switch is on."""
-        if self.coordinator.data is None:
-            return False
-        
-        energy_mode = self.coordinator.data.get("energy_system_mode", {})
-        current_mode = energy_mode.get("mode", "").lower()
-        return current_mode == self._mode
+        self._attr_device_info = coordinator.device_info
+        self._update_from_data()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Derive the switch state once per coordinator update."""
+        self._update_from_data()
+        super()._handle_coordinator_update()
+
+    def _update_from_data(self) -> None:
+        """Cache the energy system mode payload and switch state."""
+        data = self.coordinator.data
+        self._mode_data = data.get("energy_system_mode") if data is not None else None
+        if self._mode_data is None:
+            self._attr_is_on = False
+            return
+
+        current_mode = self._mode_data.get("mode", "").lower()
+        self._attr_is_on = current_mode == self._mode
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self.coordinator.data is not None
-            and self.coordinator.data.get("energy_system_mode") is not None
-        )
+        return self.coordinator.last_update_success and self._mode_data is not None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
         try:
-            mode_config = {
-                "mode": self._mode.capitalize(),
-                f"{self._mode}_cfg": {"enable": 1}
-            }
-            
-            await self.coordinator.api.set_energy_system_mode(0, mode_config)
-            await self.coordinator.async_request_refresh()
-            
+            result = await self.coordinator.api.set_energy_system_mode(0, self._mode_config)
         except MarstekAPIError as exc:
             _LOGGER.error("Failed to set %s mode: %s", self._mode, exc)
+            succeeded = False
+        else:
+            succeeded = bool(result and result.get("set_result"))
+            if not succeeded:
+                # No reply at all, or the device rejected the change
+                _LOGGER.error("Failed to set %s mode: device returned %s", self._mode, result)
+
+        data = self.coordinator.data
+        if not succeeded or data is None or data.get("energy_system_mode") is None:
+            # Show the device's real state rather than the requested one
+            await self.coordinator.async_request_refresh()
+            return
+
+        # Show the new mode right away; the next poll confirms it. New dicts
+        # are built because the client keeps references to the old payloads.
+        self.coordinator.async_set_updated_data(
+            {
+                **data,
+                "energy_system_mode": {
+                    **data["energy_system_mode"],
+                    "mode": self._mode_config["mode"],
+                },
+            }
+        )
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
@@ -89,19 +118,6 @@ class MarstekModeSwitch(CoordinatorEntity[MarstekDataUpdateCoordinator], SwitchE
         # For now, we'll just log this
         _LOGGER.warning("Cannot turn off %s mode directly. Switch to another mode instead.", self._mode)
 
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        device_info = self.coordinator.data.get("device_info", {}) if self.coordinator.data else {}
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.api.host)},
-            "name": f"Marstek {device_info.get('device', 'Device')}",
-            "manufacturer": "Marstek",
-            "model": device_info.get("device", "Unknown"),
-            "sw_version": str(device_info.get("ver", "Unknown")),
-            "hw_version": device_info.get("ble_mac", "Unknown"),
-        }
-
 
 class MarstekBatterySwitch(CoordinatorEntity[MarstekDataUpdateCoordinator], SwitchEntity):
     """Representation of a Marstek battery control switch."""
@@ -115,30 +131,32 @@ class MarstekBatterySwitch(CoordinatorEntity[MarstekDataUpdateCoordinator], Swit
         """Initialize the switch."""
         super().__init__(coordinator)
         self._switch_type = switch_type
+        self._flag_key = _BATTERY_FLAG_KEYS.get(switch_type)
         self._attr_name = f"Marstek {name}"
         self._attr_unique_id = f"marstek_battery_{switch_type}"
+        self._attr_device_info = coordinator.device_info
+        self._update_from_data()
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if the switch is on."""
-        if self.coordinator.data is None:
-            return False
-        
-        battery_data = self.coordinator.data.get("battery", {})
-        if self._switch_type == "charge":
-            return battery_data.get("charg_flag", False)
-        elif self._switch_type == "discharge":
-            return battery_data.get("dischrg_flag", False)
-        return False
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Derive the switch state once per coordinator update."""
+        self._update_from_data()
+        super()._handle_coordinator_update()
+
+    def _update_from_data(self) -> None:
+        """Cache the battery payload and switch state."""
+        data = self.coordinator.data
+        self._battery_data = data.get("battery") if data is not None else None
+        if self._battery_data is None or self._flag_key is None:
+            self._attr_is_on = False
+            return
+
+        self._attr_is_on = bool(self._battery_data.get(self._flag_key))
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success
-            and self.coordinator.data is not None
-            and self.coordinator.data.get("battery") is not None
-        )
+        return self.coordinator.last_update_success and self._battery_data is not None
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
@@ -151,16 +169,3 @@ class MarstekBatterySwitch(CoordinatorEntity[MarstekDataUpdateCoordinator], Swit
         # Note: The API documentation doesn't show how to control battery charge/discharge flags
         # This would need to be implemented based on additional API endpoints
         _LOGGER.warning("Battery control not implemented - API endpoint needed")
-
-    @property
-    def device_info(self) -> dict[str, Any]:
-        """Return device information."""
-        device_info = self.coordinator.data.get("device_info", {}) if self.coordinator.data else {}
-        return {
-            "identifiers": {(DOMAIN, self.coordinator.api.host)},
-            "name": f"Marstek {device_info.get('device', 'Device')}",
-            "manufacturer": "Marstek",
-            "model": device_info.get("device", "Unknown"),
-            "sw_version": str(device_info.get("ver", "Unknown")),
-            "hw_version": device_info.get("ble_mac", "Unknown"),
-        }
\ No newline at end of file